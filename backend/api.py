@@ -1,15 +1,18 @@
 import os
-import base64
+import threading
 import fitz
+import orjson
 import webview
 from typing import List, Dict, Any
 from .chunkers.basic import BasicWordChunker, SentenceChunker
 from .chunkers.semantic import SemanticChunker
 from .chunkers.topic import TopicChunker
+from .cache import open_doc, get_sentences, PageImageCache
 
 class Api:
-    def __init__(self):
+    def __init__(self, page_images: PageImageCache):
         self._window = None
+        self._page_images = page_images
         # Initialize chunkers
         basic_chunker = BasicWordChunker()
         sentence_chunker = SentenceChunker()
@@ -24,6 +27,13 @@ class Api:
             topic_chunker.name: topic_chunker
         }
 
+        # Load the embedding model while the window starts up, so the first
+        # semantic/topic run doesn't stall on it. Both chunkers share one instance.
+        threading.Thread(
+            target=lambda: (semantic_chunker.model, topic_chunker.model),
+            daemon=True
+        ).start()
+
     def set_window(self, window):
         self._window = window
 
@@ -42,8 +52,15 @@ class Api:
             for c in self.chunkers.values()
         ]
 
-    def process_pdf(self, pdf_path: str, algorithm_name: str) -> Dict[str, Any]:
-        """Process the PDF with the selected algorithm."""
+    def process_pdf(self, pdf_path: str, algorithm_name: str) -> str:
+        """Process the PDF with the selected algorithm.
+
+        Returns the result pre-serialized as a JSON string (parsed by the
+        frontend), so pywebview doesn't re-encode it with the stdlib encoder.
+        """
+        return _dumps(self._process_pdf(pdf_path, algorithm_name))
+
+    def _process_pdf(self, pdf_path: str, algorithm_name: str) -> Dict[str, Any]:
         if not os.path.exists(pdf_path):
             return {"error": "File not found"}
 
@@ -51,64 +68,71 @@ class Api:
         if not chunker:
             return {"error": f"Algorithm '{algorithm_name}' not found. Available: {list(self.chunkers.keys())}"}
 
+        # Rendered pages of the same PDF are reused across runs; drop any others
+        self._page_images.retain(pdf_path)
+
         try:
-            # Get document info for rendering setup on frontend
-            doc = fitz.open(pdf_path)
-            page_count = len(doc)
-            # Get dimensions of the first page (assuming uniform, but frontend can handle per page)
-            pages_info = []
-            for i in range(page_count):
-                page = doc[i]
-                rect = page.rect
-                pages_info.append({
-                    "page": i,
-                    "width": rect.width,
-                    "height": rect.height
-                })
-
-            # Run chunking
-            chunks = chunker.chunk(pdf_path)
-
-            # Serialize chunks
-            serialized_chunks = []
-            for c in chunks:
-                serialized_chunks.append({
-                    "id": c.id,
-                    "text": c.text,
-                    "bboxes": [
-                        {"page": b.page, "x0": b.x0, "y0": b.y0, "x1": b.x1, "y1": b.y1}
-                        for b in c.bboxes
-                    ],
-                    "metadata": c.metadata
-                })
-
-            return {
-                "page_count": page_count,
-                "pages": pages_info,
-                "chunks": serialized_chunks
-            }
+            # Hold the document for the whole run, since word chunks are extracted
+            # lazily; page renders requested meanwhile wait for the lock
+            with open_doc(pdf_path) as doc:
+                # Get document info for rendering setup on frontend
+                page_count = len(doc)
+                # Get dimensions of the first page (assuming uniform, but frontend can handle per page)
+                pages_info = []
+                for i in range(page_count):
+                    page = doc[i]
+                    rect = page.rect
+                    pages_info.append({
+                        "page": i,
+                        "width": rect.width,
+                        "height": rect.height
+                    })
+
+                # Run chunking, sharing the cached sentence extraction across chunkers
+                sentences = get_sentences(pdf_path) if chunker.uses_sentences else None
+                # Encode each chunk into one growing JSON array as it's produced
+                # (chunkers may yield), so neither Chunks nor per-chunk dicts are held
+                # until the end. The array is spliced verbatim into the response.
+                chunks_json = bytearray(b"[")
+                for c in chunker.chunk(doc, sentences=sentences):
+                    if len(chunks_json) > 1:
+                        chunks_json += b","
+                    chunks_json += orjson.dumps(c, option=orjson.OPT_SERIALIZE_NUMPY)
+                chunks_json += b"]"
+
+                return {
+                    "page_count": page_count,
+                    "pages": pages_info,
+                    "chunks": orjson.Fragment(bytes(chunks_json))
+                }
         except Exception as e:
             import traceback
             traceback.print_exc()
             return {"error": str(e)}
+        finally:
+            # Text extraction fills MuPDF's store (fonts, decoded images), which
+            # is unbounded by default. Release it so it doesn't compete with the
+            # embedding model for memory between runs.
+            fitz.TOOLS.store_shrink(100)
 
     def get_page_image(self, pdf_path: str, page_num: int, scale: float = 1.5) -> str:
-        """Render a PDF page to a base64 image."""
+        """Render a PDF page to a PNG file and return the URL it's served at."""
         try:
-            doc = fitz.open(pdf_path)
-            if page_num < 0 or page_num >= len(doc):
-                return None
+            with open_doc(pdf_path) as doc:
+                if page_num < 0 or page_num >= len(doc):
+                    return None
 
-            page = doc[page_num]
-            # Zoom factor
-            mat = fitz.Matrix(scale, scale)
-            pix = page.get_pixmap(matrix=mat)
+                def render() -> bytes:
+                    page = doc[page_num]
+                    # Zoom factor
+                    mat = fitz.Matrix(scale, scale)
+                    pix = page.get_pixmap(matrix=mat)
+                    return pix.tobytes("png")
 
-            # Convert to png in memory
-            img_data = pix.tobytes("png")
-            base64_img = base64.b64encode(img_data).decode("utf-8")
-
-            return f"data:image/png;base64,{base64_img}"
+                return self._page_images.get(pdf_path, page_num, scale, render)
         except Exception as e:
             print(f"Error rendering page: {e}")
             return None
+
+def _dumps(result: Dict[str, Any]) -> str:
+    return orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
@@ -0,0 +1,94 @@
+import os
+import atexit
+import shutil
+import hashlib
+import tempfile
+import threading
+import fitz
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Iterator, List, Tuple
+from .chunkers.extract import extract_sentences
+
+# Documents and sentences are keyed by (path, mtime) so that editing the PDF
+# on disk invalidates the cached entries.
+
+@lru_cache(maxsize=4)
+def _open_doc(path: str, mtime: float) -> Tuple[fitz.Document, threading.RLock]:
+    # PyMuPDF documents aren't thread-safe, and pywebview runs every js_api call
+    # on its own thread, so each cached document comes with a lock. Reentrant,
+    # since process_pdf extracts sentences while holding the document.
+    return fitz.open(path), threading.RLock()
+
+@lru_cache(maxsize=4)
+def _extract_sentences_cached(path: str, mtime: float) -> List[dict]:
+    doc, lock = _open_doc(path, mtime)
+    with lock:
+        return extract_sentences(doc)
+
+@contextmanager
+def open_doc(path: str) -> Iterator[fitz.Document]:
+    """Hold the cached, already-open document for the PDF at `path`.
+
+    The document is locked for the duration of the `with` block, so it must
+    not be used after the block exits.
+    """
+    doc, lock = _open_doc(path, os.path.getmtime(path))
+    with lock:
+        yield doc
+
+def get_sentences(path: str) -> List[dict]:
+    """Return the cached sentence list for the PDF at `path`."""
+    return _extract_sentences_cached(path, os.path.getmtime(path))
+
+class PageImageCache:
+    """Rendered page images written to a per-session temp directory.
+
+    Pages are handed to the frontend as /pages/<file> URLs served by the app
+    (see backend/server.py), so the image bytes never cross the JS bridge as
+    base64. The frontend requests every page of the current PDF at once, so
+    files are never evicted while that PDF is in use; `retain()` drops pages of
+    any other PDF.
+    """
+
+    def __init__(self):
+        self._dir = tempfile.mkdtemp(prefix="chunksmith-")
+        self._files = {}
+        self._lock = threading.Lock()
+        atexit.register(shutil.rmtree, self._dir, ignore_errors=True)
+
+    @property
+    def directory(self) -> str:
+        return self._dir
+
+    def get(self, path: str, page_num: int, scale: float, render: Callable[[], bytes]) -> str:
+        """Return the page's URL path, calling `render()` for PNG bytes on a miss."""
+        key = (path, os.path.getmtime(path), page_num, scale)
+        with self._lock:
+            if key in self._files:
+                return _page_url(self._files[key])
+
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+        image_path = os.path.join(self._dir, f"{digest}.png")
+        with open(image_path, "wb") as f:
+            f.write(render())
+
+        with self._lock:
+            self._files[key] = image_path
+        return _page_url(image_path)
+
+    def retain(self, path: str):
+        """Evict every page that doesn't belong to the current version of the PDF at `path`."""
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            for key in [k for k in self._files if k[:2] != (path, mtime)]:
+                _remove_file(self._files.pop(key))
+
+def _page_url(image_path: str) -> str:
+    return "/pages/" + os.path.basename(image_path)
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,43 @@
+import os
+import fitz
+import multiprocessing
+from typing import List, Tuple
+from .extract import extract_page_range
+
+# Mirrors PyMuPDF's multiprocessing recipe: every worker opens its own copy of
+# the document (fitz objects can't be pickled) and handles a contiguous range.
+
+def _extract_range(args: Tuple[str, int, int]) -> List[dict]:
+    pdf_path, page_start, page_end = args
+    doc = fitz.open(pdf_path)
+    try:
+        return extract_page_range(doc, page_start, page_end)
+    finally:
+        doc.close()
+
+def _page_ranges(page_count: int, num_workers: int) -> List[Tuple[int, int]]:
+    step, extra = divmod(page_count, num_workers)
+    ranges = []
+    start = 0
+    for i in range(num_workers):
+        end = start + step + (1 if i < extra else 0)
+        if end > start:
+            ranges.append((start, end))
+        start = end
+    return ranges
+
+def extract_sentences_parallel(pdf_path: str, page_count: int) -> List[dict]:
+    """Extract sentences from the whole PDF, one page range per worker process."""
+    num_workers = min(os.cpu_count() or 1, 4)
+    tasks = [(pdf_path, start, end) for start, end in _page_ranges(page_count, num_workers)]
+    if len(tasks) == 1:
+        return _extract_range(tasks[0])
+
+    sentences = []
+    # Spawn rather than fork: this runs on a pywebview worker thread next to GUI
+    # and model-loading threads, and forking a multi-threaded process can deadlock
+    with multiprocessing.get_context("spawn").Pool(processes=len(tasks)) as pool:
+        # imap preserves task order, so pages stay in reading order
+        for part in pool.imap(_extract_range, tasks):
+            sentences.extend(part)
+    return sentences
@@ -1,8 +1,12 @@
+import fitz
+import itertools
+import numpy as np
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any, Optional
 
-@dataclass
+# Sentence extraction creates one of these per text span, so keep them small
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
     page: int
     x0: float
@@ -10,14 +14,46 @@ class BoundingBox:
     x1: float
     y1: float
 
-@dataclass
+@dataclass(slots=True)
+class BoundingBoxArrays:
+    """A chunk's bounding boxes as parallel arrays.
+
+    `page` is int32 (N,) and `coords` is float64 (N, 4) of x0, y0, x1, y1.
+    """
+    page: np.ndarray
+    coords: np.ndarray
+
+@dataclass(slots=True)
 class Chunk:
     id: str
     text: str
-    bboxes: List[BoundingBox]  # A chunk might span multiple lines/areas
+    bboxes: BoundingBoxArrays  # A chunk might span multiple lines/areas
     metadata: Dict[str, Any] = None
 
+# Chunk ids only need to be unique within the running app
+_chunk_ids = itertools.count()
+
+def next_chunk_id() -> str:
+    """Return a cheap, process-unique chunk id."""
+    return f"c{next(_chunk_ids)}"
+
+def pack_bboxes(bboxes: Iterable[BoundingBox]) -> BoundingBoxArrays:
+    """Convert bounding boxes to the parallel-array layout used by `Chunk.bboxes`."""
+    pages = []
+    coords = []
+    for b in bboxes:
+        pages.append(b.page)
+        coords.append((b.x0, b.y0, b.x1, b.y1))
+    return BoundingBoxArrays(
+        page=np.asarray(pages, dtype=np.int32),
+        coords=np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+    )
+
 class BaseChunker(ABC):
+    # Set to True by chunkers that operate on extracted sentences, so the API
+    # can hand them the shared, cached sentence list instead of re-parsing.
+    uses_sentences: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -31,7 +67,10 @@ class BaseChunker(ABC):
         pass
 
     @abstractmethod
-    def chunk(self, pdf_path: str) -> List[Chunk]:
-        """Process the PDF and return a list of chunks with bounding boxes."""
+    def chunk(self, doc: fitz.Document, sentences: Optional[List[dict]] = None) -> Iterable[Chunk]:
+        """Process the open PDF document and return (or yield) chunks with bounding boxes.
+
+        `sentences` is the pre-extracted output of `extract_sentences`, if available.
+        """
         pass
 
@@ -1,7 +1,8 @@
 import fitz  # pymupdf
-from typing import List
-import uuid
-from .base import BaseChunker, Chunk, BoundingBox
+import numpy as np
+from typing import Iterator, List, Optional
+from .base import BaseChunker, Chunk, BoundingBoxArrays, pack_bboxes, next_chunk_id
+from .extract import extract_sentences
 
 class BasicWordChunker(BaseChunker):
     @property
@@ -12,9 +13,9 @@ class BasicWordChunker(BaseChunker):
     def description(self) -> str:
         return "Chunks text by words (useful for debugging bounding boxes)."
 
-    def chunk(self, pdf_path: str) -> List[Chunk]:
-        doc = fitz.open(pdf_path)
-        chunks = []
+    def chunk(self, doc: fitz.Document, sentences: Optional[List[dict]] = None) -> Iterator[Chunk]:
+        # One chunk per word can be hundreds of thousands of objects, so
+        # yield them and let the caller serialize as it goes
 
         # Iterate over pages
         for page_num in range(len(doc)):
@@ -22,29 +23,27 @@ class BasicWordChunker(BaseChunker):
             # get_text("words") returns list of (x0, y0, x1, y1, "word", block_no, line_no, word_no)
             words = page.get_text("words")
 
-            for w in words:
+            # Build the page's arrays once; each word's bboxes are views into them
+            # rather than arrays of their own
+            page_index = np.full(1, page_num, dtype=np.int32)
+            coords = np.array([w[:4] for w in words], dtype=np.float64).reshape(-1, 1, 4)
+            page_index.flags.writeable = False
+            coords.flags.writeable = False
+
+            for i, w in enumerate(words):
                 x0, y0, x1, y1, text, block, line, word_idx = w
 
                 # Create a chunk for each word
-                bbox = BoundingBox(
-                    page=page_num,
-                    x0=x0,
-                    y0=y0,
-                    x1=x1,
-                    y1=y1
-                )
-
-                chunk = Chunk(
-                    id=str(uuid.uuid4()),
+                yield Chunk(
+                    id=next_chunk_id(),
                     text=text,
-                    bboxes=[bbox],
+                    bboxes=BoundingBoxArrays(page=page_index, coords=coords[i]),
                     metadata={"block": block, "line": line}
                 )
-                chunks.append(chunk)
-
-        return chunks
 
 class SentenceChunker(BaseChunker):
+    uses_sentences = True
+
     @property
     def name(self) -> str:
         return "Sentence Chunker"
@@ -53,58 +52,16 @@ class SentenceChunker(BaseChunker):
     def description(self) -> str:
         return "Chunks text by sentences (approximate)."
 
-    def chunk(self, pdf_path: str) -> List[Chunk]:
-        doc = fitz.open(pdf_path)
-        chunks = []
-
-        # Very naive implementation relying on PyMuPDF's text extraction structure
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            # Extract dict to get structural info
-            blocks = page.get_text("dict")["blocks"]
-
-            for block in blocks:
-                if "lines" not in block:
-                    continue
-
-                current_sentence_text = ""
-                current_sentence_bboxes = []
-
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"]
-                        bbox = span["bbox"]
-
-                        current_sentence_text += text + " "
-                        current_sentence_bboxes.append(BoundingBox(
-                            page=page_num,
-                            x0=bbox[0],
-                            y0=bbox[1],
-                            x1=bbox[2],
-                            y1=bbox[3]
-                        ))
-
-                        # Simple splitting on period (very naive)
-                        if text.strip().endswith("."):
-                            chunk = Chunk(
-                                id=str(uuid.uuid4()),
-                                text=current_sentence_text.strip(),
-                                bboxes=current_sentence_bboxes,
-                                metadata={}
-                            )
-                            chunks.append(chunk)
-                            current_sentence_text = ""
-                            current_sentence_bboxes = []
-
-                # Add remaining text in block
-                if current_sentence_text.strip():
-                    chunk = Chunk(
-                        id=str(uuid.uuid4()),
-                        text=current_sentence_text.strip(),
-                        bboxes=current_sentence_bboxes,
-                        metadata={}
-                    )
-                    chunks.append(chunk)
-
-        return chunks
-
+    def chunk(self, doc: fitz.Document, sentences: Optional[List[dict]] = None) -> List[Chunk]:
+        if sentences is None:
+            sentences = extract_sentences(doc)
+
+        return [
+            Chunk(
+                id=next_chunk_id(),
+                text=s["text"],
+                bboxes=pack_bboxes(s["bboxes"]),
+                metadata={}
+            )
+            for s in sentences
+        ]
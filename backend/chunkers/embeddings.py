@@ -0,0 +1,121 @@
+import os
+import threading
+import numpy as np
+from functools import lru_cache
+from typing import List
+
+# Quantized models are exported once and reused across runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "chunksmith")
+
+# Serializes loading so concurrent callers (e.g. the startup preload and a
+# chunk() call) don't load, or export to CACHE_DIR, the same model twice
+_load_lock = threading.Lock()
+
+def load_embedding_model(model_name: str):
+    """Return the shared embedding model for `model_name`, loading it on first use.
+
+    The model exposes SentenceTransformer's `encode()`. On GPU this is the fp16
+    SentenceTransformer; on CPU an int8 ONNX Runtime export.
+    """
+    with _load_lock:
+        return _load_embedding_model(model_name)
+
+@lru_cache(maxsize=None)
+def _load_embedding_model(model_name: str):
+    print(f"Loading embedding model: {model_name}...")
+    # Lazy imports to speed up app startup
+    import torch
+    if torch.cuda.is_available():
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(model_name)
+        # Half precision halves the bytes moved per batch on GPU
+        model.half()
+        return model
+    return QuantizedEncoder(model_name)
+
+def encode_unique(model, texts: List[str]) -> np.ndarray:
+    """Encode `texts`, running the model only once per distinct string.
+
+    Repeated headers/footers and overlapping windows are common in PDFs.
+    """
+    index = {}
+    inverse = np.fromiter(
+        (index.setdefault(t, len(index)) for t in texts), dtype=np.intp, count=len(texts)
+    )
+    unique_embeddings = model.encode(
+        list(index),
+        batch_size=64,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+    return unique_embeddings[inverse]
+
+class QuantizedEncoder:
+    """Dynamically int8-quantized ONNX Runtime model with mean pooling."""
+
+    def __init__(self, model_name: str, max_seq_length: int = 256):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        model_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        save_dir = os.path.join(CACHE_DIR, model_id.replace("/", "--") + "-int8")
+
+        if not os.path.exists(os.path.join(save_dir, "model_quantized.onnx")):
+            print(f"Exporting int8 ONNX model for {model_id}...")
+            ort_model = ORTModelForFeatureExtraction.from_pretrained(
+                model_id, export=True, provider="CPUExecutionProvider"
+            )
+            ort_model.save_pretrained(save_dir)
+            AutoTokenizer.from_pretrained(model_id).save_pretrained(save_dir)
+
+            quantizer = ORTQuantizer.from_pretrained(ort_model)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=save_dir, quantization_config=qconfig)
+
+        self.max_seq_length = max_seq_length
+        self.tokenizer = AutoTokenizer.from_pretrained(save_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            save_dir, file_name="model_quantized.onnx", provider="CPUExecutionProvider"
+        )
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """Mirror of `SentenceTransformer.encode` for a list of strings; always returns an ndarray."""
+        # Batch similar lengths together to minimize padding, then restore the input order
+        order = np.argsort([-len(s) for s in sentences], kind="stable")
+        batches = []
+
+        for start in range(0, len(sentences), batch_size):
+            batch = [sentences[i] for i in order[start:start + batch_size]]
+            inputs = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            token_embeddings = self.model(**inputs).last_hidden_state
+
+            # Mean pooling over non-padding tokens
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            batches.append(summed / np.clip(mask.sum(axis=1), 1e-9, None))
+
+        if not batches:
+            return np.empty((0, self.model.config.hidden_size), dtype=np.float32)
+
+        sorted_embeddings = np.concatenate(batches).astype(np.float32, copy=False)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+
+        if normalize_embeddings:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
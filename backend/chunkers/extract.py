@@ -0,0 +1,87 @@
+import fitz
+import pysbd
+from bisect import bisect_left, bisect_right
+from typing import List
+from .base import BoundingBox
+
+# Rule-based splitter: handles abbreviations, decimals and lists without an ML model.
+# char_span=True returns character offsets, which requires clean=False.
+_SEGMENTER = pysbd.Segmenter(language="en", clean=False, char_span=True)
+
+# Spawned workers take ~0.5-1s to start (importing fitz and pysbd), while
+# extraction runs at roughly 15-20ms per page, so smaller PDFs stay sequential
+PARALLEL_MIN_PAGES = 64
+
+def extract_sentences(doc: fitz.Document) -> List[dict]:
+    """Extract sentences with their bounding boxes from the PDF.
+
+    Returns a list of {"text", "bboxes"} dicts in reading order. Shared by all
+    sentence-based chunkers so a document only has to be parsed once.
+    Larger documents opened from disk are split across a process pool.
+    """
+    page_count = len(doc)
+    if page_count >= PARALLEL_MIN_PAGES and doc.name:
+        from ._parallel import extract_sentences_parallel
+        return extract_sentences_parallel(doc.name, page_count)
+    return extract_page_range(doc, 0, page_count)
+
+def extract_page_range(doc: fitz.Document, page_start: int, page_end: int) -> List[dict]:
+    """Extract sentences from pages [page_start, page_end) of an open document."""
+    sentences = []
+
+    for page_num in range(page_start, page_end):
+        page = doc[page_num]
+        blocks = page.get_text("dict")["blocks"]
+
+        for block in blocks:
+            if "lines" not in block:
+                continue
+
+            # Join the whole block, remembering where each span starts so
+            # sentence character ranges can be mapped back to span bboxes
+            block_text = ""
+            span_starts = []
+            span_bboxes = []
+
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    bbox = span["bbox"]
+
+                    # Handle basic whitespace to avoid words gluing together
+                    if block_text and not block_text.endswith(" "):
+                        block_text += " "
+
+                    span_starts.append(len(block_text))
+                    span_bboxes.append(BoundingBox(
+                        page=page_num,
+                        x0=bbox[0],
+                        y0=bbox[1],
+                        x1=bbox[2],
+                        y1=bbox[3]
+                    ))
+                    block_text += span["text"]
+
+            # Text left at the end of a block becomes its own sentence, which
+            # handles bullet points that don't end in punctuation
+            sentences.extend(_split_block(block_text, span_starts, span_bboxes))
+
+    return sentences
+
+def _split_block(block_text: str, span_starts: List[int], span_bboxes: List[BoundingBox]) -> List[dict]:
+    if not block_text.strip():
+        return []
+
+    sentences = []
+    for seg in _SEGMENTER.segment(block_text):
+        text = seg.sent.strip()
+        if not text:
+            continue
+        # Spans overlapping the sentence, excluding pysbd's trailing whitespace
+        seg_end = seg.start + len(seg.sent.rstrip())
+        first = max(bisect_right(span_starts, seg.start) - 1, 0)
+        last = bisect_left(span_starts, seg_end)
+        sentences.append({
+            "text": text,
+            "bboxes": span_bboxes[first:last]
+        })
+    return sentences
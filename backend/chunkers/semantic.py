@@ -1,10 +1,13 @@
 import fitz
-import uuid
 import numpy as np
-from typing import List, Tuple, Dict
-from .base import BaseChunker, Chunk, BoundingBox
+from typing import List, Optional
+from .base import BaseChunker, Chunk, pack_bboxes, next_chunk_id
+from .extract import extract_sentences
+from .embeddings import load_embedding_model, encode_unique
 
 class SemanticChunker(BaseChunker):
+    uses_sentences = True
+
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", percentile_threshold: float = 90.0, window_size: int = 1):
         """
         Args:
@@ -29,72 +32,16 @@ class SemanticChunker(BaseChunker):
     @property
     def model(self):
         if self._model is None:
-            print(f"Loading embedding model: {self.model_name}...")
-            # Lazy import to speed up app startup
-            from sentence_transformers import SentenceTransformer
-            self._model = SentenceTransformer(self.model_name)
+            # Shared across chunkers using the same model, and safe to call
+            # while the background preload is still running
+            self._model = load_embedding_model(self.model_name)
         return self._model
 
-    def _extract_sentences(self, doc: fitz.Document) -> List[dict]:
-        """Extract sentences with their bounding boxes from the PDF."""
-        sentences = []
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            blocks = page.get_text("dict")["blocks"]
-
-            for block in blocks:
-                if "lines" not in block:
-                    continue
-
-                current_sent_text = ""
-                current_sent_bboxes = []
-
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"]
-                        bbox = span["bbox"]
-
-                        # Handle basic whitespace to avoid words gluing together
-                        if current_sent_text and not current_sent_text.endswith(" "):
-                             current_sent_text += " "
-
-                        current_sent_text += text
-                        current_sent_bboxes.append(BoundingBox(
-                            page=page_num,
-                            x0=bbox[0],
-                            y0=bbox[1],
-                            x1=bbox[2],
-                            y1=bbox[3]
-                        ))
-
-                        # Naive sentence splitting: Period, !, ? or essentially newline if it looks like a bullet
-                        # If text ends with a punctuation mark, we split.
-                        if text.strip().endswith((".", "!", "?")):
-                            sentences.append({
-                                "text": current_sent_text.strip(),
-                                "bboxes": current_sent_bboxes
-                            })
-                            current_sent_text = ""
-                            current_sent_bboxes = []
-
-                # Capture any remaining text in the block as a sentence
-                # This handles bullet points that don't end in punctuation but are in separate blocks/lines
-                if current_sent_text.strip():
-                    sentences.append({
-                        "text": current_sent_text.strip(),
-                        "bboxes": current_sent_bboxes
-                    })
-
-        return sentences
-
-    def chunk(self, pdf_path: str) -> List[Chunk]:
-        from sklearn.metrics.pairwise import cosine_similarity
-
-        doc = fitz.open(pdf_path)
-
-        # 1. Extract sentences
-        sentences_data = self._extract_sentences(doc)
+    def chunk(self, doc: fitz.Document, sentences: Optional[List[dict]] = None) -> List[Chunk]:
+        # 1. Extract sentences (unless the caller already did)
+        sentences_data = sentences
+        if sentences_data is None:
+            sentences_data = extract_sentences(doc)
         if not sentences_data:
             return []
 
@@ -109,37 +56,38 @@ class SemanticChunker(BaseChunker):
 
         # 3. Compute embeddings
         print(f"Generating embeddings for {len(texts_to_embed)} windows...")
-        embeddings = self.model.encode(texts_to_embed)
+        embeddings = encode_unique(self.model, texts_to_embed)
 
         # 4. Calculate cosine distances between adjacent sentences
-        distances = []
-        for i in range(len(embeddings) - 1):
-            sim = cosine_similarity([embeddings[i]], [embeddings[i+1]])[0][0]
-            # Clamp sim to [-1, 1] just in case
-            sim = max(-1.0, min(1.0, sim))
-            dist = 1 - sim
-            distances.append(dist)
+        # Row-normalize once so every adjacent cosine similarity is a single dot product
+        E = np.asarray(embeddings, dtype=np.float32)
+        E = E / np.maximum(np.linalg.norm(E, axis=1, keepdims=True), 1e-12)
+        sims = np.einsum('ij,ij->i', E[:-1], E[1:])
+        # Clamp sim to [-1, 1] just in case
+        np.clip(sims, -1.0, 1.0, out=sims)
+        distances = 1.0 - sims
 
         # 5. Determine Threshold
-        if not distances:
+        if len(distances) == 0:
             # Only one sentence
             return [self._create_chunk(sentences_data, 0, 1)]
 
         # Calculate the percentile threshold
         # e.g., 90th percentile means we only split at the top 10% of distances
-        threshold = np.percentile(distances, self.percentile_threshold)
+        # Only one order statistic is needed, so partition (O(N)) instead of sorting
+        # Same index as np.quantile(..., method="lower")
+        k = int((len(distances) - 1) * self.percentile_threshold / 100.0)
+        threshold = np.partition(distances, k)[k]
         print(f"Calculated split threshold: {threshold:.4f} (Percentile: {self.percentile_threshold})")
 
         # 6. Split
         chunks = []
         start_idx = 0
 
-        for i, dist in enumerate(distances):
-            if dist > threshold:
-                # Split occurring after sentence i (so i is the last sentence of current chunk)
-                end_idx = i + 1
-                chunks.append(self._create_chunk(sentences_data, start_idx, end_idx))
-                start_idx = end_idx
+        # A split after sentence i (so i is the last sentence of current chunk)
+        for end_idx in (np.flatnonzero(distances > threshold) + 1).tolist():
+            chunks.append(self._create_chunk(sentences_data, start_idx, end_idx))
+            start_idx = end_idx
 
         # Final chunk
         if start_idx < len(sentences_data):
@@ -155,8 +103,8 @@ class SemanticChunker(BaseChunker):
             combined_bboxes.extend(s["bboxes"])
 
         return Chunk(
-            id=str(uuid.uuid4()),
+            id=next_chunk_id(),
             text=combined_text,
-            bboxes=combined_bboxes,
+            bboxes=pack_bboxes(combined_bboxes),
             metadata={"sentence_count": len(subset)}
         )
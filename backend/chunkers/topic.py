@@ -1,10 +1,13 @@
 import fitz
-import uuid
 import numpy as np
-from typing import List
-from .base import BaseChunker, Chunk, BoundingBox
+from typing import List, Optional
+from .base import BaseChunker, Chunk, pack_bboxes, next_chunk_id
+from .extract import extract_sentences
+from .embeddings import load_embedding_model, encode_unique
 
 class TopicChunker(BaseChunker):
+    uses_sentences = True
+
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", num_topics: int = 5):
         self.model_name = model_name
         self.num_topics = num_topics
@@ -21,68 +24,18 @@ class TopicChunker(BaseChunker):
     @property
     def model(self):
         if self._model is None:
-            print(f"Loading embedding model: {self.model_name}...")
-            # Lazy import to speed up app startup
-            from sentence_transformers import SentenceTransformer
-            self._model = SentenceTransformer(self.model_name)
+            # Shared across chunkers using the same model, and safe to call
+            # while the background preload is still running
+            self._model = load_embedding_model(self.model_name)
         return self._model
 
-    def _extract_sentences(self, doc: fitz.Document) -> List[dict]:
-        """Extract sentences/segments with their bounding boxes."""
-        # Reuse similar logic to SemanticChunker, extracting sentences as atomic units
-        sentences = []
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            blocks = page.get_text("dict")["blocks"]
-
-            for block in blocks:
-                if "lines" not in block:
-                    continue
-
-                # We treat each block as a potential source of sentences
-                current_sent_text = ""
-                current_sent_bboxes = []
-
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text = span["text"]
-                        bbox = span["bbox"]
-
-                        if current_sent_text and not current_sent_text.endswith(" "):
-                             current_sent_text += " "
-
-                        current_sent_text += text
-                        current_sent_bboxes.append(BoundingBox(
-                            page=page_num,
-                            x0=bbox[0],
-                            y0=bbox[1],
-                            x1=bbox[2],
-                            y1=bbox[3]
-                        ))
-
-                        if text.strip().endswith((".", "!", "?")):
-                            sentences.append({
-                                "text": current_sent_text.strip(),
-                                "bboxes": current_sent_bboxes
-                            })
-                            current_sent_text = ""
-                            current_sent_bboxes = []
-
-                if current_sent_text.strip():
-                    sentences.append({
-                        "text": current_sent_text.strip(),
-                        "bboxes": current_sent_bboxes
-                    })
-        return sentences
-
-    def chunk(self, pdf_path: str) -> List[Chunk]:
-        from sklearn.cluster import KMeans
-
-        doc = fitz.open(pdf_path)
-
-        # 1. Extract sentences
-        sentences_data = self._extract_sentences(doc)
+    def chunk(self, doc: fitz.Document, sentences: Optional[List[dict]] = None) -> List[Chunk]:
+        from sklearn.cluster import MiniBatchKMeans
+
+        # 1. Extract sentences (unless the caller already did)
+        sentences_data = sentences
+        if sentences_data is None:
+            sentences_data = extract_sentences(doc)
         if not sentences_data:
             return []
 
@@ -93,11 +46,18 @@ class TopicChunker(BaseChunker):
         # 2. Embed sentences
         texts = [s["text"] for s in sentences_data]
         print(f"Generating embeddings for {len(texts)} sentences...")
-        embeddings = self.model.encode(texts)
+        embeddings = encode_unique(self.model, texts)
 
         # 3. Cluster
         print(f"Clustering into {self.num_topics} topics...")
-        kmeans = KMeans(n_clusters=self.num_topics, random_state=42, n_init=10)
+        # Embeddings are L2-normalized, so Euclidean k-means here is cosine k-means
+        kmeans = MiniBatchKMeans(
+            n_clusters=self.num_topics,
+            random_state=42,
+            n_init=3,
+            batch_size=1024,
+            max_iter=100
+        )
         labels = kmeans.fit_predict(embeddings)
 
         # 4. Group by Label
@@ -126,9 +86,9 @@ class TopicChunker(BaseChunker):
             combined_text = "\n\n---\n\n".join(combined_text_parts)
 
             chunks.append(Chunk(
-                id=str(uuid.uuid4()),
+                id=next_chunk_id(),
                 text=f"TOPIC {label + 1}:\n" + combined_text,
-                bboxes=combined_bboxes,
+                bboxes=pack_bboxes(combined_bboxes),
                 metadata={"topic_id": int(label), "sentence_count": len(cluster_sentences)}
             ))
 
@@ -140,8 +100,8 @@ class TopicChunker(BaseChunker):
         for s in sentences_data:
             combined_bboxes.extend(s["bboxes"])
         return [Chunk(
-            id=str(uuid.uuid4()),
+            id=next_chunk_id(),
             text="Full Document (Too few sentences for topic modeling)",
-            bboxes=combined_bboxes,
+            bboxes=pack_bboxes(combined_bboxes),
             metadata={}
         )]
@@ -0,0 +1,23 @@
+import bottle
+from .cache import PageImageCache
+
+def create_app(frontend_dir: str, page_images: PageImageCache) -> bottle.Bottle:
+    """WSGI app serving the frontend and rendered pages from one origin.
+
+    pywebview serves local pages over http://127.0.0.1, and webviews refuse to
+    load file:// images into an http page, so page PNGs are served next to the UI.
+    """
+    app = bottle.Bottle()
+
+    @app.route("/pages/<name>")
+    def page_image(name):
+        return bottle.static_file(name, root=page_images.directory, mimetype="image/png")
+
+    @app.route("/")
+    @app.route("/<file:path>")
+    def asset(file="index.html"):
+        # Don't let the webview keep stale frontend files between runs
+        bottle.response.set_header("Cache-Control", "no-cache")
+        return bottle.static_file(file, root=frontend_dir)
+
+    return app
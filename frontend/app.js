@@ -47,7 +47,8 @@ document.getElementById('btn-process').addEventListener('click', async () => {
     document.getElementById('btn-process').disabled = true;
 
     try {
-        const result = await window.pywebview.api.process_pdf(currentPdfPath, algoName);
+        // The backend returns a pre-serialized JSON string
+        const result = JSON.parse(await window.pywebview.api.process_pdf(currentPdfPath, algoName));
 
         if (result.error) {
             alert("Error: " + result.error);
@@ -123,10 +124,15 @@ async function renderPdfPages(count) {
 
         // Fetch image data
         // Note: This might be slow for large PDFs. In a prod app, implement lazy loading.
-        const p = window.pywebview.api.get_page_image(currentPdfPath, i, 1.5).then(dataUrl => {
+        const p = window.pywebview.api.get_page_image(currentPdfPath, i, 1.5).then(imageUrl => {
             return new Promise((resolve) => {
                 img.onload = () => resolve();
-                img.src = dataUrl;
+                // Don't let one failed page keep the whole render pending
+                img.onerror = () => {
+                    console.error(`Failed to load page ${i + 1}`);
+                    resolve();
+                };
+                img.src = imageUrl;
             });
         });
         loadPromises.push(p);
@@ -177,10 +183,12 @@ function highlightChunkOnPdf(index) {
     if (!chunk || !chunk.bboxes) return;
 
     // Group bboxes by page
+    // bboxes arrive as parallel arrays: page[i] and coords[i] = [x0, y0, x1, y1]
     const bboxesByPage = {};
-    chunk.bboxes.forEach(bbox => {
-        if (!bboxesByPage[bbox.page]) bboxesByPage[bbox.page] = [];
-        bboxesByPage[bbox.page].push(bbox);
+    chunk.bboxes.page.forEach((page, i) => {
+        const [x0, y0, x1, y1] = chunk.bboxes.coords[i];
+        if (!bboxesByPage[page]) bboxesByPage[page] = [];
+        bboxesByPage[page].push({ x0, y0, x1, y1 });
     });
 
     let firstBboxElement = null;
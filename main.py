@@ -1,17 +1,21 @@
 import os
 import webview
 from backend.api import Api
+from backend.cache import PageImageCache
+from backend.server import create_app
 
 def main():
-    api = Api()
+    page_images = PageImageCache()
+    api = Api(page_images)
 
     # Locate the frontend directory
     frontend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend')
-    entry_html = os.path.join(frontend_dir, 'index.html')
 
+    # pywebview serves the app over http://127.0.0.1; rendered pages are served
+    # from the same origin, since the webview won't load file:// images there
     window = webview.create_window(
         'PDF Chunker',
-        url=entry_html,
+        url=create_app(frontend_dir, page_images),
         js_api=api,
         width=1200,
         height=800
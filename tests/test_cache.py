@@ -0,0 +1,28 @@
+import threading
+import fitz
+from backend.cache import open_doc, get_sentences
+
+def _pdf(tmp_path):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "One sentence. Another one.")
+    path = str(tmp_path / "doc.pdf")
+    doc.save(path)
+    return path
+
+def test_open_doc_serializes_threads_on_the_same_document(tmp_path):
+    path = _pdf(tmp_path)
+    entered = threading.Event()
+
+    def other():
+        with open_doc(path):
+            entered.set()
+
+    with open_doc(path) as doc:
+        thread = threading.Thread(target=other)
+        thread.start()
+        assert not entered.wait(0.2)
+        # The holder can still reach the cached extraction of its own document
+        assert [s["text"] for s in get_sentences(path)] == ["One sentence.", "Another one."]
+        assert len(doc) == 1
+    thread.join(5)
+    assert entered.is_set()
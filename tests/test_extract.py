@@ -0,0 +1,87 @@
+import fitz
+from backend.chunkers.base import BoundingBox
+from backend.chunkers.extract import _split_block, extract_sentences
+
+def _box(i):
+    return BoundingBox(page=0, x0=i, y0=i, x1=i + 1, y1=i + 1)
+
+def _join(spans):
+    text = ""
+    starts = []
+    for span in spans:
+        if text and not text.endswith(" "):
+            text += " "
+        starts.append(len(text))
+        text += span
+    return text, starts
+
+def _squash(text):
+    return "".join(text.split())
+
+def test_split_block_maps_sentences_to_overlapping_spans():
+    spans = ["Dr. Smith paid", "$3.50 for it. Then", "more text"]
+    text, starts = _join(spans)
+    boxes = [_box(i) for i in range(len(spans))]
+
+    sentences = _split_block(text, starts, boxes)
+
+    assert [s["text"] for s in sentences] == ["Dr. Smith paid $3.50 for it.", "Then more text"]
+    # The middle span holds the end of one sentence and the start of the next
+    assert sentences[0]["bboxes"] == boxes[0:2]
+    assert sentences[1]["bboxes"] == boxes[1:3]
+
+def test_split_block_sentence_within_single_span():
+    spans = ["One. Two. Three."]
+    text, starts = _join(spans)
+    sentences = _split_block(text, starts, [_box(0)])
+
+    assert [s["text"] for s in sentences] == ["One.", "Two.", "Three."]
+    assert all(s["bboxes"] == [_box(0)] for s in sentences)
+
+def test_split_block_ignores_trailing_whitespace_of_next_span():
+    # MuPDF spans often start with the space separating them from the previous one
+    spans = ["Hello there.", " World is big."]
+    text, starts = _join(spans)
+    boxes = [_box(i) for i in range(len(spans))]
+
+    sentences = _split_block(text, starts, boxes)
+
+    assert [s["text"] for s in sentences] == ["Hello there.", "World is big."]
+    assert sentences[0]["bboxes"] == boxes[0:1]
+    assert sentences[1]["bboxes"] == boxes[1:2]
+
+def test_split_block_keeps_all_text():
+    spans = ["Intro line", "with e.g. an abbreviation. Next", "sentence!", "- a bullet", "without punctuation"]
+    text, starts = _join(spans)
+    sentences = _split_block(text, starts, [_box(i) for i in range(len(spans))])
+
+    assert _squash("".join(s["text"] for s in sentences)) == _squash(text)
+    assert all(s["bboxes"] for s in sentences)
+
+def test_split_block_ignores_blank_text():
+    assert _split_block("   ", [0], [_box(0)]) == []
+
+def test_extract_sentences_covers_page_text():
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_textbox(
+        fitz.Rect(72, 72, 300, 300),
+        "The quick brown fox jumps over the lazy dog. It was e.g. a fine day at "
+        "3.5 degrees. Then the end came quickly for everyone involved here.",
+        fontsize=11
+    )
+
+    sentences = extract_sentences(doc)
+
+    assert [s["text"] for s in sentences] == [
+        "The quick brown fox jumps over the lazy dog.",
+        "It was e.g. a fine day at 3.5 degrees.",
+        "Then the end came quickly for everyone involved here."
+    ]
+    assert _squash("".join(s["text"] for s in sentences)) == _squash(page.get_text())
+    text_rect = fitz.Rect(72, 72, 300, 300)
+    for s in sentences:
+        assert s["bboxes"]
+        for b in s["bboxes"]:
+            assert b.page == 0
+            assert fitz.Rect(b.x0, b.y0, b.x1, b.y1) in text_rect + (-1, -1, 1, 1)
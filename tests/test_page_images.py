@@ -0,0 +1,42 @@
+from wsgiref.util import setup_testing_defaults
+from backend.cache import PageImageCache
+from backend.server import create_app
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+def _get(app, url):
+    environ = {"PATH_INFO": url}
+    setup_testing_defaults(environ)
+    status = []
+    body = b"".join(app(environ, lambda s, headers, exc_info=None: status.append(s)))
+    return int(status[0].split()[0]), body
+
+def _pdf(tmp_path, name):
+    path = tmp_path / name
+    path.write_bytes(b"%PDF")
+    return str(path)
+
+def test_page_urls_are_served_by_the_app(tmp_path):
+    cache = PageImageCache()
+    app = create_app(str(tmp_path), cache)
+    pdf = _pdf(tmp_path, "a.pdf")
+
+    url = cache.get(pdf, 0, 1.5, lambda: PNG)
+
+    assert url.startswith("/pages/")
+    assert _get(app, url) == (200, PNG)
+    # Hits return the same file without rendering again
+    assert cache.get(pdf, 0, 1.5, lambda: b"rendered twice") == url
+
+def test_retain_evicts_pages_of_other_pdfs(tmp_path):
+    cache = PageImageCache()
+    app = create_app(str(tmp_path), cache)
+    a = _pdf(tmp_path, "a.pdf")
+    b = _pdf(tmp_path, "b.pdf")
+    url_a = cache.get(a, 0, 1.5, lambda: PNG)
+    url_b = cache.get(b, 0, 1.5, lambda: PNG)
+
+    cache.retain(b)
+
+    assert _get(app, url_a)[0] == 404
+    assert _get(app, url_b) == (200, PNG)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from backend.chunkers.semantic import SemanticChunker
+
+class _StubModel:
+    """Returns a fixed random embedding per text."""
+
+    def __init__(self, texts):
+        rng = np.random.default_rng(0)
+        self.vectors = {t: rng.standard_normal(8).astype(np.float32) for t in texts}
+
+    def encode(self, texts, **kwargs):
+        return np.stack([self.vectors[t] for t in texts])
+
+def _sentences(n):
+    return [{"text": f"Sentence {i}.", "bboxes": []} for i in range(n)]
+
+@pytest.mark.parametrize("n", [2, 5, 10, 11, 20])
+@pytest.mark.parametrize("percentile", [0.0, 90.0, 100.0])
+def test_split_count_matches_lower_quantile(n, percentile):
+    sentences = _sentences(n)
+    model = _StubModel([s["text"] for s in sentences])
+    chunker = SemanticChunker(percentile_threshold=percentile, window_size=0)
+    chunker._model = model
+
+    chunks = chunker.chunk(None, sentences=sentences)
+
+    E = model.encode([s["text"] for s in sentences])
+    E = E / np.linalg.norm(E, axis=1, keepdims=True)
+    distances = 1.0 - np.clip(np.einsum("ij,ij->i", E[:-1], E[1:]), -1.0, 1.0)
+    threshold = np.quantile(distances, percentile / 100.0, method="lower")
+    assert len(chunks) == np.count_nonzero(distances > threshold) + 1
+    assert sum(c.metadata["sentence_count"] for c in chunks) == n